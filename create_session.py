@@ -1,69 +1,93 @@
 """Create authenticated LinkedIn session with proper verification."""
 
+import argparse
 import asyncio
-from linkedin_scraper import BrowserManager, is_logged_in
+import logging
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from linkedin_scraper import BrowserManager
+from linkedin_scraper.core import setup_queue_logging
 
+from script_utils import ENDPOINT_FILE, PROFILE_DIR, add_browser_args, log_wait_progress
 
-async def create_session():
-    async with BrowserManager(headless=False) as browser:
-        print("\n" + "="* 60)
-        print("Step 1: Opening LinkedIn...")
-        print("=" * 60)
+logger = logging.getLogger(__name__)
 
-        await browser.page.goto("https://www.linkedin.com/login")
-        await asyncio.sleep(3)
-
-        print("\n" + "=" * 60)
-        print("Step 2: Please LOG IN to LinkedIn in the browser window")
-        print("IMPORTANT: After logging in, navigate to your FEED page")
-        print("          (https://www.linkedin.com/feed/)")
-        print("\nWaiting for 5 MINUTES for you to complete login...")
-        print("=" * 60)
-
-        # Check login status every 10 seconds for up to 5 minutes
-        max_attempts = 30  # 30 x 10 seconds = 5 minutes
-        logged_in = False
+# How long to wait for the user to log in (seconds)
+LOGIN_TIMEOUT = 300
 
-        for attempt in range(max_attempts):
-            await asyncio.sleep(10)
 
-            # Check if logged in
-            logged_in = await is_logged_in(browser.page)
+async def create_session(endpoint_file=None, user_data_dir=None):
+    async with BrowserManager(
+        headless=False,
+        endpoint_file=endpoint_file,
+        user_data_dir=user_data_dir
+    ) as browser:
+        logger.info("\n" + "="* 60)
+        logger.info("Step 1: Opening LinkedIn...")
+        logger.info("=" * 60)
 
-            time_elapsed = (attempt + 1) * 10
-            time_remaining = (max_attempts * 10) - time_elapsed
+        await browser.page.goto("https://www.linkedin.com/login")
+        await asyncio.sleep(3)
 
-            if logged_in:
-                print(f"\n[{time_elapsed}s] LOGIN DETECTED!")
-                break
-            else:
-                print(f"[{time_elapsed}s] Not logged in yet... ({time_remaining}s remaining)")
+        logger.info("\n" + "=" * 60)
+        logger.info("Step 2: Please LOG IN to LinkedIn in the browser window")
+        logger.info("IMPORTANT: After logging in, navigate to your FEED page")
+        logger.info("          (https://www.linkedin.com/feed/)")
+        logger.info("\nWaiting for 5 MINUTES for you to complete login...")
+        logger.info("=" * 60)
+
+        start = asyncio.get_running_loop().time()
+
+        # Wake up as soon as the browser lands on the feed, logging progress meanwhile
+        progress = asyncio.create_task(
+            log_wait_progress(LOGIN_TIMEOUT, message="Not logged in yet...")
+        )
+        try:
+            await browser.page.wait_for_url("**/feed/**", timeout=LOGIN_TIMEOUT * 1000)
+            logged_in = True
+        except PlaywrightTimeoutError:
+            logged_in = False
+        finally:
+            progress.cancel()
 
         if logged_in:
-            print("\n" + "=" * 60)
-            print("SUCCESS: You are logged in!")
-            print("Saving session...")
-            print("=" * 60)
+            elapsed = int(asyncio.get_running_loop().time() - start)
+            logger.info("\n[%ds] LOGIN DETECTED!", elapsed)
+
+            logger.info("\n" + "=" * 60)
+            logger.info("SUCCESS: You are logged in!")
+            logger.info("Saving session...")
+            logger.info("=" * 60)
 
             await browser.save_session("session.json")
 
-            print("\nSession saved successfully to session.json")
-            print("You can now use this session to scrape LinkedIn")
-            print("\nKeeping browser open for 10 more seconds...")
+            logger.info("\nSession saved successfully to session.json")
+            logger.info("You can now use this session to scrape LinkedIn")
+            logger.info("\nKeeping browser open for 10 more seconds...")
             await asyncio.sleep(10)
         else:
-            print("\n" + "=" * 60)
-            print("WARNING: Login not detected after 5 minutes")
-            print("Please make sure you:")
-            print("  1. Completed the login process")
-            print("  2. Navigated to https://www.linkedin.com/feed/")
-            print("  3. Can see your LinkedIn feed")
-            print("\nSaving session anyway (may not work)...")
-            print("=" * 60)
+            logger.info("\n" + "=" * 60)
+            logger.warning("WARNING: Login not detected after 5 minutes")
+            logger.info("Please make sure you:")
+            logger.info("  1. Completed the login process")
+            logger.info("  2. Navigated to https://www.linkedin.com/feed/")
+            logger.info("  3. Can see your LinkedIn feed")
+            logger.info("\nSaving session anyway (may not work)...")
+            logger.info("=" * 60)
 
             await browser.save_session("session.json")
             await asyncio.sleep(10)
 
 
 if __name__ == "__main__":
-    asyncio.run(create_session())
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_browser_args(parser, profile=True)
+    args = parser.parse_args()
+
+    listener = setup_queue_logging()
+    try:
+        asyncio.run(create_session(
+            endpoint_file=ENDPOINT_FILE if args.reuse_endpoint else None,
+            user_data_dir=PROFILE_DIR if args.profile else None
+        ))
+    finally:
+        listener.stop()
@@ -6,18 +6,22 @@ __version__ = "3.0.1"
 # Core modules
 from .core import (
     BrowserManager,
+    ContextPool,
     login_with_credentials,
     login_with_cookie,
     is_logged_in,
     wait_for_manual_login,
     load_credentials_from_env,
+    RateLimiter,
     # Exceptions
     LinkedInScraperException,
     AuthenticationError,
     RateLimitError,
+    TooManyRequestsError,
     ElementNotFoundError,
     ProfileNotFoundError,
     NetworkError,
+    ServerError,
     ScrapingError,
 )
 
@@ -57,11 +61,13 @@ __all__ = [
     "__version__",
     # Core
     "BrowserManager",
+    "ContextPool",
     "login_with_credentials",
     "login_with_cookie",
     "is_logged_in",
     "wait_for_manual_login",
     "load_credentials_from_env",
+    "RateLimiter",
     # Scrapers
     "PersonScraper",
     "CompanyScraper",
@@ -72,9 +78,11 @@ __all__ = [
     "LinkedInScraperException",
     "AuthenticationError",
     "RateLimitError",
+    "TooManyRequestsError",
     "ElementNotFoundError",
     "ProfileNotFoundError",
     "NetworkError",
+    "ServerError",
     "ScrapingError",
     # Callbacks
     "ProgressCallback",
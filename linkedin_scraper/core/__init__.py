@@ -1,6 +1,7 @@
 """Core modules for LinkedIn scraper."""
 
 from .browser import BrowserManager
+from .pool import ContextPool
 from .auth import (
     login_with_credentials,
     login_with_cookie,
@@ -13,17 +14,22 @@ from .exceptions import (
     LinkedInScraperException,
     AuthenticationError,
     RateLimitError,
+    TooManyRequestsError,
     ElementNotFoundError,
     ProfileNotFoundError,
     NetworkError,
+    ServerError,
     ScrapingError
 )
 from .utils import (
     retry_async,
+    setup_queue_logging,
+    RateLimiter,
     detect_rate_limit,
     wait_for_element_smart,
     extract_text_safe,
     scroll_to_bottom,
+    scroll_until_loaded,
     scroll_to_half,
     click_see_more_buttons,
     handle_modal_close,
@@ -33,6 +39,7 @@ from .utils import (
 __all__ = [
     # Browser
     'BrowserManager',
+    'ContextPool',
     # Auth
     'login_with_credentials',
     'login_with_cookie',
@@ -44,16 +51,21 @@ __all__ = [
     'LinkedInScraperException',
     'AuthenticationError',
     'RateLimitError',
+    'TooManyRequestsError',
     'ElementNotFoundError',
     'ProfileNotFoundError',
     'NetworkError',
+    'ServerError',
     'ScrapingError',
     # Utils
     'retry_async',
+    'setup_queue_logging',
+    'RateLimiter',
     'detect_rate_limit',
     'wait_for_element_smart',
     'extract_text_safe',
     'scroll_to_bottom',
+    'scroll_until_loaded',
     'scroll_to_half',
     'click_see_more_buttons',
     'handle_modal_close',
@@ -3,6 +3,8 @@
 import asyncio
 import logging
 import os
+import time
+import weakref
 from typing import Optional, Tuple
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from dotenv import load_dotenv
@@ -12,6 +14,13 @@ from .utils import detect_rate_limit
 
 logger = logging.getLogger(__name__)
 
+# Seconds an is_logged_in() result stays valid for an unchanged page
+LOGIN_CHECK_TTL = 2.0
+
+# Page -> (url, checked_at, logged_in); cleared when the page navigates
+_login_cache: "weakref.WeakKeyDictionary[Page, Tuple[str, float, bool]]" = weakref.WeakKeyDictionary()
+_watched_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
 
 async def warm_up_browser(page: Page) -> None:
     """
@@ -236,22 +245,48 @@ async def login_with_cookie(page: Page, cookie_value: str) -> None:
         raise AuthenticationError(f"Cookie authentication error: {e}")
 
 
-async def is_logged_in(page: Page) -> bool:
+async def is_logged_in(page: Page, use_cache: bool = True) -> bool:
     """
     Check if currently logged in to LinkedIn.
     
+    Results are cached per page for LOGIN_CHECK_TTL seconds and dropped as
+    soon as the page navigates, so repeated checks skip the DOM query.
+    
     Args:
         page: Playwright page object
+        use_cache: Reuse a recent result for the same page and URL
         
     Returns:
         True if logged in, False otherwise
     """
+    if use_cache:
+        cached = _login_cache.get(page)
+        if (
+            cached is not None
+            and cached[0] == page.url
+            and time.monotonic() - cached[1] < LOGIN_CHECK_TTL
+        ):
+            return cached[2]
+    
     try:
         # Check for global nav which only appears when logged in
         count = await page.locator('.global-nav__primary-link, [data-control-name="nav.settings"]').count()
-        return count > 0
+        logged_in = count > 0
     except Exception:
         return False
+    
+    if page not in _watched_pages:
+        page.on("framenavigated", lambda frame: _invalidate_login_cache(page, frame))
+        _watched_pages.add(page)
+    _login_cache[page] = (page.url, time.monotonic(), logged_in)
+    
+    return logged_in
+
+
+def _invalidate_login_cache(page: Page, frame) -> None:
+    """Forget the cached login state when the page's main frame navigates."""
+    if frame == page.main_frame:
+        _login_cache.pop(page, None)
 
 
 async def wait_for_manual_login(page: Page, timeout: int = 300000) -> None:
@@ -270,20 +305,16 @@ async def wait_for_manual_login(page: Page, timeout: int = 300000) -> None:
         "Waiting up to 5 minutes..."
     )
     
-    start_time = asyncio.get_event_loop().time()
+    # Let the browser wake us when the logged-in nav appears instead of polling
+    try:
+        await page.wait_for_selector(
+            '.global-nav__primary-link, [data-control-name="nav.settings"]',
+            timeout=timeout,
+            state='attached'
+        )
+    except PlaywrightTimeoutError:
+        raise AuthenticationError(
+            "Manual login timeout. Please try again and complete login faster."
+        )
     
-    while True:
-        # Check if logged in
-        if await is_logged_in(page):
-            logger.info("✓ Manual login completed successfully")
-            return
-        
-        # Check timeout
-        elapsed = (asyncio.get_event_loop().time() - start_time) * 1000
-        if elapsed > timeout:
-            raise AuthenticationError(
-                "Manual login timeout. Please try again and complete login faster."
-            )
-        
-        # Wait a bit before checking again
-        await asyncio.sleep(1)
+    logger.info("✓ Manual login completed successfully")
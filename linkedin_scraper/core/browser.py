@@ -3,14 +3,83 @@
 import asyncio
 import json
 import logging
+import subprocess
+import sys
+import tempfile
 from pathlib import Path
 from typing import Optional, Dict, Any
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright, Route
 
 from .exceptions import NetworkError
 
 logger = logging.getLogger(__name__)
 
+# Resource types scrapers never read; aborting them saves bandwidth per page.
+# Stylesheets are kept because visibility checks and inner_text depend on them.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+
+async def _abort_blocked_resource(route: Route) -> None:
+    """Abort requests for blocked resource types and let the rest through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# One Playwright driver per process, shared by all open BrowserManagers
+_playwright_instance: Optional[Playwright] = None
+_playwright_loop: Optional[asyncio.AbstractEventLoop] = None
+_playwright_refcount = 0
+_playwright_lock: Optional[asyncio.Lock] = None
+
+
+async def _acquire_playwright() -> Playwright:
+    """Return the shared Playwright instance, starting the driver if needed."""
+    global _playwright_instance, _playwright_loop, _playwright_refcount, _playwright_lock
+    
+    loop = asyncio.get_running_loop()
+    if _playwright_lock is None or _playwright_loop is not loop:
+        # Instances are bound to the loop that started them
+        _playwright_instance = None
+        _playwright_loop = loop
+        _playwright_refcount = 0
+        _playwright_lock = asyncio.Lock()
+    
+    async with _playwright_lock:
+        if _playwright_instance is None:
+            _playwright_instance = await async_playwright().start()
+            logger.debug("Playwright driver started")
+        _playwright_refcount += 1
+        return _playwright_instance
+
+
+async def _release_playwright() -> None:
+    """Drop one reference to the shared Playwright instance, stopping it at zero."""
+    global _playwright_instance, _playwright_refcount
+    
+    if _playwright_lock is None or _playwright_loop is not asyncio.get_running_loop():
+        return
+    
+    async with _playwright_lock:
+        _playwright_refcount -= 1
+        if _playwright_refcount <= 0 and _playwright_instance is not None:
+            instance = _playwright_instance
+            _playwright_instance = None
+            _playwright_refcount = 0
+            await instance.stop()
+            logger.debug("Playwright driver stopped")
+
+
+async def block_heavy_resources(context: BrowserContext) -> None:
+    """
+    Stop a context from downloading images, fonts and media.
+    
+    Args:
+        context: Playwright browser context
+    """
+    await context.route("**/*", _abort_blocked_resource)
+
 
 class BrowserManager:
     """Async context manager for Playwright browser lifecycle."""
@@ -21,6 +90,10 @@ class BrowserManager:
         slow_mo: int = 0,
         viewport: Optional[Dict[str, int]] = None,
         user_agent: Optional[str] = None,
+        endpoint_file: Optional[str] = None,
+        debugging_port: int = 9222,
+        block_resources: bool = False,
+        user_data_dir: Optional[str] = None,
         **launch_options: Any
     ):
         """
@@ -31,13 +104,29 @@ class BrowserManager:
             slow_mo: Slow down operations by specified milliseconds
             viewport: Browser viewport size (default: 1280x720)
             user_agent: Custom user agent string
+            endpoint_file: If set, attach to the browser whose CDP endpoint is
+                stored in this file, launching a detached one if none is running.
+                The browser is left running on close so later runs skip cold start.
+            debugging_port: Remote debugging port for a browser launched
+                via endpoint_file
+            block_resources: Abort image, font and media requests in every context
+            user_data_dir: If set, launch a persistent context stored in this
+                directory so cookies, TLS session tickets and HTTP cache survive
+                between runs. Not combinable with endpoint_file.
             **launch_options: Additional Playwright launch options
         """
+        if endpoint_file and user_data_dir:
+            raise ValueError("endpoint_file and user_data_dir cannot be used together")
+        
         self.headless = headless
         self.slow_mo = slow_mo
         self.viewport = viewport or {"width": 1280, "height": 720}
         self.user_agent = user_agent
         self.launch_options = launch_options
+        self.endpoint_file = endpoint_file
+        self.debugging_port = debugging_port
+        self.block_resources = block_resources
+        self.user_data_dir = user_data_dir
         
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
@@ -57,16 +146,7 @@ class BrowserManager:
     async def start(self) -> None:
         """Start Playwright and launch browser."""
         try:
-            self._playwright = await async_playwright().start()
-            
-            # Launch browser
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.headless,
-                slow_mo=self.slow_mo,
-                **self.launch_options
-            )
-            
-            logger.info(f"Browser launched (headless={self.headless})")
+            self._playwright = await _acquire_playwright()
             
             # Create context
             context_options: Dict[str, Any] = {
@@ -76,10 +156,45 @@ class BrowserManager:
             if self.user_agent:
                 context_options["user_agent"] = self.user_agent
             
-            self._context = await self._browser.new_context(**context_options)
+            if self.user_data_dir:
+                # Browser and context are one persistent profile
+                self._context = await self._playwright.chromium.launch_persistent_context(
+                    self.user_data_dir,
+                    headless=self.headless,
+                    slow_mo=self.slow_mo,
+                    **context_options,
+                    **self.launch_options
+                )
+                self._browser = self._context.browser
+                
+                logger.info(
+                    f"Browser launched with profile {self.user_data_dir} (headless={self.headless})"
+                )
+            else:
+                if self.endpoint_file:
+                    await self.attach_or_launch()
+                else:
+                    # Launch browser
+                    self._browser = await self._playwright.chromium.launch(
+                        headless=self.headless,
+                        slow_mo=self.slow_mo,
+                        **self.launch_options
+                    )
+                    
+                    logger.info(f"Browser launched (headless={self.headless})")
+                
+                if not self._browser:
+                    raise RuntimeError("Browser not started")
+                self._context = await self._browser.new_context(**context_options)
+            
+            if self.block_resources:
+                await block_heavy_resources(self._context)
             
-            # Create initial page
-            self._page = await self._context.new_page()
+            # Create initial page, reusing the tab a persistent profile opens with
+            if self.user_data_dir and self._context.pages:
+                self._page = self._context.pages[0]
+            else:
+                self._page = await self._context.new_page()
             
             logger.info("Browser context and page created")
             
@@ -87,6 +202,86 @@ class BrowserManager:
             await self.close()
             raise NetworkError(f"Failed to start browser: {e}")
     
+    async def attach_or_launch(self) -> None:
+        """
+        Attach to the browser recorded in endpoint_file, or launch a new one.
+        
+        A newly launched browser runs detached from this process and its CDP
+        endpoint is written to endpoint_file for the next run to attach to.
+        """
+        if not self._playwright or not self.endpoint_file:
+            raise RuntimeError("Playwright not started or endpoint_file not set")
+        
+        endpoint_path = Path(self.endpoint_file)
+        if endpoint_path.exists():
+            endpoint = endpoint_path.read_text().strip()
+            try:
+                self._browser = await self._playwright.chromium.connect_over_cdp(
+                    endpoint, slow_mo=self.slow_mo
+                )
+                logger.info(f"Attached to running browser at {endpoint}")
+                return
+            except Exception as e:
+                logger.info(f"Could not attach to {endpoint}, launching new browser: {e}")
+        
+        endpoint = self._launch_detached()
+        
+        # Give the detached browser time to open its debugging port
+        last_error: Optional[Exception] = None
+        for _ in range(20):
+            try:
+                self._browser = await self._playwright.chromium.connect_over_cdp(
+                    endpoint, slow_mo=self.slow_mo
+                )
+                break
+            except Exception as e:
+                last_error = e
+                await asyncio.sleep(0.5)
+        else:
+            raise NetworkError(f"Could not connect to launched browser at {endpoint}: {last_error}")
+        
+        endpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        endpoint_path.write_text(endpoint)
+        
+        logger.info(f"Browser launched at {endpoint} (headless={self.headless})")
+    
+    def _launch_detached(self) -> str:
+        """
+        Start Chromium outside Playwright's process tree so it outlives this run.
+        
+        Returns:
+            CDP endpoint URL of the launched browser
+        """
+        if not self._playwright:
+            raise RuntimeError("Playwright not started")
+        
+        profile_dir = Path(tempfile.gettempdir()) / f"linkedin_scraper_cdp_{self.debugging_port}"
+        args = [
+            self._playwright.chromium.executable_path,
+            f"--remote-debugging-port={self.debugging_port}",
+            f"--user-data-dir={profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            *self.launch_options.get("args", []),
+        ]
+        if self.headless:
+            args.append("--headless=new")
+        
+        popen_options: Dict[str, Any] = {
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.DEVNULL,
+        }
+        if sys.platform == "win32":
+            popen_options["creationflags"] = (
+                subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            )
+        else:
+            popen_options["start_new_session"] = True
+        
+        subprocess.Popen(args, **popen_options)
+        
+        return f"http://127.0.0.1:{self.debugging_port}"
+    
     async def close(self) -> None:
         """Close browser and cleanup resources."""
         try:
@@ -99,17 +294,21 @@ class BrowserManager:
                 self._context = None
             
             if self._browser:
+                # For a browser attached over CDP this only disconnects,
+                # leaving it running for the next run to reuse
                 await self._browser.close()
                 self._browser = None
             
-            if self._playwright:
-                await self._playwright.stop()
-                self._playwright = None
-            
             logger.info("Browser closed")
             
         except Exception as e:
             logger.error(f"Error closing browser: {e}")
+        
+        finally:
+            # Always drop our reference so the shared driver can stop
+            if self._playwright:
+                self._playwright = None
+                await _release_playwright()
     
     async def new_page(self) -> Page:
         """
@@ -157,6 +356,8 @@ class BrowserManager:
             Playwright browser
         """
         if not self._browser:
+            if self.user_data_dir and self._context:
+                raise RuntimeError("No separate browser instance when using user_data_dir.")
             raise RuntimeError("Browser not started.")
         return self._browser
     
@@ -190,6 +391,19 @@ class BrowserManager:
         if not Path(filepath).exists():
             raise FileNotFoundError(f"Session file not found: {filepath}")
         
+        if self.user_data_dir:
+            # A persistent profile can't be replaced; merge the cookies into it
+            if not self._context:
+                raise RuntimeError("Browser not started")
+            
+            with open(filepath) as f:
+                storage_state = json.load(f)
+            await self._context.add_cookies(storage_state.get("cookies", []))
+            
+            self._is_authenticated = True
+            logger.info(f"Session cookies loaded from {filepath} into profile")
+            return
+        
         # Close existing context and create new one with stored state
         if self._context:
             await self._context.close()
@@ -202,6 +416,8 @@ class BrowserManager:
             viewport=self.viewport,
             user_agent=self.user_agent
         )
+        if self.block_resources:
+            await block_heavy_resources(self._context)
         
         # Create new page
         if self._page:
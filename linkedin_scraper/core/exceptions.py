@@ -19,6 +19,11 @@ class RateLimitError(LinkedInScraperException):
         self.suggested_wait_time = suggested_wait_time
 
 
+class TooManyRequestsError(RateLimitError):
+    """Raised when LinkedIn responds with HTTP 429. Transient, so safe to retry."""
+    pass
+
+
 class ElementNotFoundError(LinkedInScraperException):
     """Raised when an expected element is not found."""
     pass
@@ -34,6 +39,11 @@ class NetworkError(LinkedInScraperException):
     pass
 
 
+class ServerError(NetworkError):
+    """Raised when LinkedIn responds with an HTTP 5xx error."""
+    pass
+
+
 class ScrapingError(LinkedInScraperException):
     """Raised when scraping fails for various reasons."""
     pass
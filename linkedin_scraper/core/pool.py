@@ -0,0 +1,191 @@
+"""Pool of pre-warmed browser contexts for parallel scraping."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional, Set
+
+from playwright.async_api import Browser, BrowserContext, Page
+
+from .browser import block_heavy_resources
+
+logger = logging.getLogger(__name__)
+
+
+class ContextPool:
+    """
+    Async pool of isolated browser contexts sharing one session.
+
+    Contexts are created once up front and handed out with acquire/release,
+    so concurrent scrapers each get their own tab without paying the
+    context launch cost per request.
+
+    Example:
+        async with BrowserManager(headless=False) as browser:
+            async with ContextPool(browser.browser, size=4, storage_state="session.json") as pool:
+                async with pool.lease() as page:
+                    job = await JobScraper(page).scrape(url)
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        size: int = 4,
+        storage_state: Optional[str] = None,
+        block_resources: bool = False,
+        **context_options: Any
+    ):
+        """
+        Initialize context pool.
+
+        Args:
+            browser: Playwright browser to create contexts in
+            size: Number of contexts to keep in the pool
+            storage_state: Optional session file loaded into every context
+            block_resources: Abort image, font and media requests in every context
+            **context_options: Additional options for browser.new_context()
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.browser = browser
+        self.size = size
+        self.storage_state = storage_state
+        self.block_resources = block_resources
+        self.context_options = context_options
+
+        self._queue: Optional["asyncio.Queue[BrowserContext]"] = None
+        self._contexts: Set[BrowserContext] = set()
+        self._closed_contexts: Set[BrowserContext] = set()
+        self._closing = False
+
+    async def __aenter__(self) -> "ContextPool":
+        """Create the pooled contexts."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close all pooled contexts."""
+        await self.close()
+
+    async def start(self) -> None:
+        """Create ``size`` contexts and put them in the pool."""
+        if self.storage_state and not Path(self.storage_state).exists():
+            raise FileNotFoundError(f"Session file not found: {self.storage_state}")
+
+        self._queue = asyncio.Queue()
+        self._closing = False
+
+        contexts = await asyncio.gather(
+            *[self._new_context() for _ in range(self.size)]
+        )
+        for context in contexts:
+            self._queue.put_nowait(context)
+
+        logger.info(f"Context pool started with {self.size} contexts")
+
+    async def close(self) -> None:
+        """Close every context owned by the pool."""
+        self._closing = True
+
+        for context in list(self._contexts):
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled context: {e}")
+
+        self._contexts.clear()
+        self._closed_contexts.clear()
+        self._queue = None
+
+        logger.info("Context pool closed")
+
+    async def _new_context(self) -> BrowserContext:
+        """Create a context and watch it for unexpected closure."""
+        options = dict(self.context_options)
+        if self.storage_state:
+            options["storage_state"] = self.storage_state
+
+        context = await self.browser.new_context(**options)
+        if self.block_resources:
+            await block_heavy_resources(context)
+        context.on("close", lambda _: self._on_context_close(context))
+        self._contexts.add(context)
+        return context
+
+    def _on_context_close(self, context: BrowserContext) -> None:
+        """Mark a context as dead so it is replaced on release."""
+        self._contexts.discard(context)
+        if not self._closing:
+            logger.warning("Pooled browser context closed unexpectedly")
+            self._closed_contexts.add(context)
+
+    async def acquire(self) -> BrowserContext:
+        """
+        Take a context from the pool, waiting if none are free.
+
+        Returns:
+            Playwright browser context
+        """
+        if self._queue is None:
+            raise RuntimeError("Context pool not started. Use async context manager or call start().")
+
+        context = await self._queue.get()
+
+        # Replace contexts that crashed while sitting in the pool
+        if context in self._closed_contexts:
+            try:
+                replacement = await self._new_context()
+            except Exception:
+                # Put the dead slot back so the pool doesn't shrink
+                self._queue.put_nowait(context)
+                raise
+            self._closed_contexts.discard(context)
+            context = replacement
+
+        return context
+
+    async def release(self, context: BrowserContext) -> None:
+        """
+        Return a context to the pool, recreating it if it has crashed.
+
+        Args:
+            context: Context previously returned by acquire()
+        """
+        if self._queue is None:
+            return
+
+        if context in self._closed_contexts:
+            try:
+                replacement = await self._new_context()
+                self._closed_contexts.discard(context)
+                context = replacement
+            except Exception as e:
+                # Keep the dead slot queued so the next acquire() retries
+                logger.error(f"Failed to recreate pooled context: {e}")
+
+        self._queue.put_nowait(context)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Page]:
+        """
+        Borrow a context and yield a fresh page in it.
+
+        The page is closed and the context returned to the pool on exit.
+
+        Yields:
+            New Playwright page
+        """
+        context = await self.acquire()
+        try:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.debug(f"Error closing leased page: {e}")
+        finally:
+            await self.release(context)
@@ -3,6 +3,11 @@
 import asyncio
 import functools
 import logging
+import queue
+import random
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Callable, Optional, TypeVar, cast
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
@@ -16,7 +21,10 @@ T = TypeVar('T')
 def retry_async(
     max_attempts: int = 3,
     backoff: float = 2.0,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    jitter: float = 0.0,
+    respect_suggested_wait: bool = False,
+    max_suggested_wait: Optional[float] = None
 ):
     """
     Decorator for async functions to add retry logic with exponential backoff.
@@ -25,6 +33,12 @@ def retry_async(
         max_attempts: Maximum number of retry attempts
         backoff: Backoff multiplier for exponential backoff
         exceptions: Tuple of exceptions to catch and retry
+        jitter: Maximum random seconds added to each wait so that
+            concurrent callers don't retry in lockstep
+        respect_suggested_wait: Wait at least the exception's
+            ``suggested_wait_time`` (e.g. from Retry-After) when it has one
+        max_suggested_wait: Give up at once instead of waiting when the
+            suggested wait is longer than this many seconds
     
     Returns:
         Decorated function with retry logic
@@ -40,9 +54,19 @@ def retry_async(
                     last_exception = e
                     if attempt < max_attempts - 1:
                         wait_time = backoff ** attempt
+                        if respect_suggested_wait:
+                            suggested = getattr(e, 'suggested_wait_time', 0)
+                            if max_suggested_wait is not None and suggested > max_suggested_wait:
+                                logger.error(
+                                    f"Attempt {attempt + 1}/{max_attempts} failed: {e}. "
+                                    f"Suggested wait of {suggested}s is too long, giving up"
+                                )
+                                raise
+                            wait_time = max(wait_time, suggested)
+                        wait_time += random.uniform(0, jitter)
                         logger.warning(
                             f"Attempt {attempt + 1}/{max_attempts} failed: {e}. "
-                            f"Retrying in {wait_time}s..."
+                            f"Retrying in {wait_time:.1f}s..."
                         )
                         await asyncio.sleep(wait_time)
                     else:
@@ -54,6 +78,100 @@ def retry_async(
     return decorator
 
 
+def setup_queue_logging(
+    level: int = logging.INFO,
+    fmt: str = "%(message)s",
+    library_level: int = logging.WARNING
+) -> QueueListener:
+    """
+    Send log records to stdout through a queue so writes happen off the event loop.
+    
+    Records are handed to a QueueHandler on the calling thread and written
+    by a QueueListener thread, so a slow terminal never blocks scraping tasks.
+    
+    Args:
+        level: Root logger level
+        fmt: Log record format
+        library_level: Level for this package's own loggers
+        
+    Returns:
+        Started QueueListener; call stop() before exit to flush pending records
+    """
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(fmt))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+    logging.getLogger("linkedin_scraper").setLevel(library_level)
+    
+    listener.start()
+    return listener
+
+
+class RateLimiter:
+    """
+    Async token bucket that paces operations globally across tasks.
+    
+    Allows bursts of up to ``max_rate`` operations and refills at
+    ``max_rate / time_period`` tokens per second.
+    
+    Example:
+        limiter = RateLimiter(max_rate=20, time_period=60)
+        async with limiter:
+            await scraper.scrape(url)
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            max_rate: Maximum number of operations per time period
+            time_period: Length of the time period in seconds
+        """
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+        
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+    
+    def _refill(self) -> None:
+        """Add tokens accumulated since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.max_rate, self._tokens + elapsed * self._rate_per_sec)
+        self._last_refill = now
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        # Waiters queue on the lock so tokens are handed out in FIFO order
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate_per_sec)
+    
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
 async def detect_rate_limit(page: Page) -> None:
     """
     Detect if LinkedIn has rate limited the session.
@@ -205,6 +323,70 @@ async def scroll_to_bottom(page: Page, pause_time: float = 1.0, max_scrolls: int
             break
 
 
+async def scroll_until_loaded(
+    page: Page,
+    item_selector: str,
+    limit: Optional[int] = None,
+    pause_time: float = 1.0,
+    max_scrolls: int = 10
+) -> int:
+    """
+    Scroll to the bottom until no new items load, waiting only as long as needed.
+    
+    After each scroll the browser is watched for the page growing or more
+    items matching ``item_selector`` appearing; scrolling stops as soon as
+    nothing new shows up within ``pause_time``.
+    
+    Links are counted once per href (ignoring the query string), so a card
+    with several links to the same target counts as one item.
+    
+    Args:
+        page: Playwright page object
+        item_selector: CSS selector of the items being loaded
+        limit: Stop once at least this many distinct items are on the page
+        pause_time: Maximum time to wait for new content after a scroll (seconds)
+        max_scrolls: Maximum number of scroll attempts
+        
+    Returns:
+        Number of distinct matching items found at the last scroll
+    """
+    count = 0
+    for i in range(max_scrolls):
+        state = await page.evaluate(
+            """(selector) => {
+                const height = document.body.scrollHeight;
+                window.scrollTo(0, height);
+                const items = document.querySelectorAll(selector);
+                const unique = new Set();
+                for (const el of items) {
+                    const href = el.getAttribute('href');
+                    unique.add(href ? href.split('?')[0] : el);
+                }
+                return {height, total: items.length, count: unique.size};
+            }""",
+            item_selector
+        )
+        count = state["count"]
+        
+        if limit is not None and count >= limit:
+            logger.debug(f"Found {count} items after {i + 1} scrolls")
+            break
+        
+        try:
+            await page.wait_for_function(
+                """([selector, height, total]) =>
+                    document.body.scrollHeight > height ||
+                    document.querySelectorAll(selector).length > total""",
+                arg=[item_selector, state["height"], state["total"]],
+                timeout=pause_time * 1000
+            )
+        except PlaywrightTimeoutError:
+            logger.debug(f"No new content after {i + 1} scrolls")
+            break
+    
+    return count
+
+
 async def scroll_to_half(page: Page) -> None:
     """Scroll to middle of page."""
     await page.evaluate('window.scrollTo(0, document.body.scrollHeight / 2)')
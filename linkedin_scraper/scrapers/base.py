@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
@@ -10,16 +12,45 @@ from ..core import (
     is_logged_in,
     detect_rate_limit,
     scroll_to_bottom,
+    scroll_until_loaded,
     scroll_to_half,
     click_see_more_buttons,
     handle_modal_close,
     extract_text_safe,
     retry_async,
 )
-from ..core.exceptions import AuthenticationError, ScrapingError
+from ..core.exceptions import (
+    AuthenticationError,
+    RateLimitError,
+    ScrapingError,
+    ServerError,
+    TooManyRequestsError,
+)
 
 logger = logging.getLogger(__name__)
 
+# Wait suggested for a 429 without a usable Retry-After header (seconds)
+DEFAULT_RETRY_AFTER = 60
+
+# LinkedIn's non-standard "Request denied" status for suspected bots
+LINKEDIN_REQUEST_DENIED = 999
+
+
+def _retry_after_seconds(value: Optional[str], default: int = DEFAULT_RETRY_AFTER) -> int:
+    """Parse a Retry-After header given as delay-seconds or an HTTP date."""
+    if not value:
+        return default
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, int((retry_at - datetime.now(timezone.utc)).total_seconds()))
+
 
 class BaseScraper:
     """Base class with common scraping functionality."""
@@ -66,6 +97,29 @@ class BaseScraper:
         """
         await scroll_to_bottom(self.page, pause_time, max_scrolls)
     
+    async def scroll_page_until_loaded(
+        self,
+        item_selector: str,
+        limit: Optional[int] = None,
+        pause_time: float = 1.0,
+        max_scrolls: int = 10
+    ) -> int:
+        """
+        Scroll to bottom until no new items load.
+        
+        Args:
+            item_selector: CSS selector of the items being loaded
+            limit: Stop once at least this many distinct items are on the page
+            pause_time: Maximum wait for new content after each scroll
+            max_scrolls: Maximum number of scroll attempts
+            
+        Returns:
+            Number of distinct matching items found at the last scroll
+        """
+        return await scroll_until_loaded(
+            self.page, item_selector, limit, pause_time, max_scrolls
+        )
+    
     async def scroll_page_to_half(self) -> None:
         """Scroll to middle of page."""
         await scroll_to_half(self.page)
@@ -161,10 +215,29 @@ class BaseScraper:
             url: URL to navigate to
             wait_until: Wait condition (domcontentloaded, networkidle, load)
             timeout: Timeout in milliseconds (default: 60000 = 60s)
+            
+        Raises:
+            TooManyRequestsError: If LinkedIn responds with HTTP 429
+            ServerError: If LinkedIn responds with HTTP 5xx
+            RateLimitError: If LinkedIn denies the request (HTTP 999) or a
+                checkpoint, CAPTCHA or rate limit page is shown
         """
         logger.info(f"Navigating to: {url}")
         # Use type: ignore to bypass strict typing
-        await self.page.goto(url, wait_until=wait_until, timeout=timeout)  # type: ignore
+        response = await self.page.goto(url, wait_until=wait_until, timeout=timeout)  # type: ignore
+        if response is not None:
+            if response.status == 429:
+                raise TooManyRequestsError(
+                    f"LinkedIn returned HTTP 429 Too Many Requests for {url}",
+                    suggested_wait_time=_retry_after_seconds(response.headers.get("retry-after"))
+                )
+            if response.status == LINKEDIN_REQUEST_DENIED:
+                raise RateLimitError(
+                    f"LinkedIn denied the request (HTTP 999) for {url}",
+                    suggested_wait_time=3600
+                )
+            if 500 <= response.status < 600:
+                raise ServerError(f"LinkedIn returned HTTP {response.status} for {url}")
         await self.check_rate_limit()
     
     async def extract_list_items(
@@ -15,6 +15,9 @@ from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+JOB_LINK_SELECTOR = 'a[href*="/jobs/view/"]'
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+
 
 class SavedJobsScraper(BaseScraper):
     """Scraper for LinkedIn Saved Jobs list."""
@@ -41,7 +44,7 @@ class SavedJobsScraper(BaseScraper):
         Args:
             limit: Maximum number of job URLs to return
             max_scrolls: Maximum scroll attempts to load more jobs
-            pause_time: Pause between scrolls (seconds)
+            pause_time: Maximum wait for new jobs after each scroll (seconds)
 
         Returns:
             List of saved job URLs
@@ -66,8 +69,11 @@ class SavedJobsScraper(BaseScraper):
             await self.wait_and_focus(1)
 
             await self.close_modals()
-            await self.scroll_page_to_bottom(
-                pause_time=pause_time, max_scrolls=max_scrolls
+            await self.scroll_page_until_loaded(
+                JOB_LINK_SELECTOR,
+                limit=limit,
+                pause_time=pause_time,
+                max_scrolls=max_scrolls,
             )
 
             job_urls = await self._extract_job_urls(limit)
@@ -91,33 +97,40 @@ class SavedJobsScraper(BaseScraper):
         Returns:
             List of job posting URLs
         """
-        job_urls: list[str] = []
-        seen_urls: set[str] = set()
-
         try:
-            job_links = await self.page.locator('a[href*="/jobs/view/"]').all()
-
-            for link in job_links:
-                if len(job_urls) >= limit:
-                    break
-
-                try:
-                    href = await link.get_attribute("href")
-                    if not href or "/jobs/view/" not in href:
-                        continue
+            # Read every href in one round-trip instead of one per link
+            hrefs: list[Optional[str]] = await self.page.eval_on_selector_all(
+                JOB_LINK_SELECTOR,
+                "els => els.map(e => e.getAttribute('href'))",
+            )
+        except Exception as e:
+            logger.warning("Error extracting saved job URLs: %s", e)
+            return []
 
-                    clean_url = href.split("?")[0] if "?" in href else href
-                    if not clean_url.startswith("http"):
-                        clean_url = f"https://www.linkedin.com{clean_url}"
+        return self.clean_job_urls(hrefs)[:limit]
 
-                    if clean_url not in seen_urls:
-                        job_urls.append(clean_url)
-                        seen_urls.add(clean_url)
-                except Exception as e:
-                    logger.debug("Error extracting saved job URL: %s", e)
-                    continue
+    @staticmethod
+    def clean_job_urls(hrefs: list[Optional[str]]) -> list[str]:
+        """
+        Turn raw job link hrefs into unique absolute URLs without query strings.
 
-        except Exception as e:
-            logger.warning("Error extracting saved job URLs: %s", e)
+        Args:
+            hrefs: href attribute values, possibly relative or None
 
-        return job_urls
+        Returns:
+            Cleaned job URLs in first-seen order
+        """
+        base_url = LINKEDIN_BASE_URL
+        clean_urls: dict[str, None] = {}
+        for href in hrefs:
+            if not href or "/jobs/view/" not in href:
+                continue
+
+            # One scan to drop the query string
+            clean_url = href.partition("?")[0]
+            if not clean_url.startswith("http"):
+                clean_url = base_url + clean_url
+            clean_urls[clean_url] = None
+
+        # Dict keys dedupe while preserving page order
+        return list(clean_urls)
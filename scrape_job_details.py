@@ -1,69 +1,231 @@
 """Scrape full details for saved jobs."""
 
+import argparse
 import asyncio
 import json
-from linkedin_scraper import BrowserManager, JobScraper
+import logging
+import os
+from dataclasses import dataclass, field
+from linkedin_scraper import (
+    BrowserManager,
+    ContextPool,
+    JobScraper,
+    RateLimiter,
+    ServerError,
+    TooManyRequestsError,
+)
+from linkedin_scraper.core import retry_async, setup_queue_logging
+
+from script_utils import DEFAULT_CONCURRENCY, ENDPOINT_FILE, add_browser_args, file_ends_with_newline
+
+logger = logging.getLogger(__name__)
+
+# Trim browser overhead that job pages don't need
+LAUNCH_ARGS = ["--disable-gpu", "--disable-dev-shm-usage", "--mute-audio"]
+
+# One JSON object per line, appended as each job finishes
+OUTPUT_FILE = "saved_jobs_details.jsonl"
+
+# Attempts per job on HTTP 429/5xx. Waits 1s, 2s, 4s, 8s plus jitter, or
+# longer when a 429 carries Retry-After. Checkpoints and CAPTCHAs fail at once.
+MAX_ATTEMPTS = 5
+
+# Give up on a job rather than sleep longer than this for one Retry-After (seconds)
+MAX_RETRY_WAIT = 120
+
+
+@dataclass
+class ScrapeConfig:
+    """Concurrency settings kept in one place so they can't drift apart.
+
+    - concurrency: jobs scraped at once. Sizes both the semaphore and the
+      context pool, so every in-flight scrape has its own context and the
+      number of open tabs/connections never exceeds it.
+    - max_rate / time_period: global pacing shared by all tasks. Caps
+      requests per minute no matter how high concurrency is.
+    """
+
+    concurrency: int = field(
+        default_factory=lambda: int(os.getenv("LNKD_CONCURRENCY", DEFAULT_CONCURRENCY))
+    )
+    max_rate: int = 20
+    time_period: float = 60
+
+    def __post_init__(self):
+        if self.concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {self.concurrency}")
+
+    def semaphore(self):
+        """Semaphore capping in-flight scrapes at ``concurrency``."""
+        return asyncio.BoundedSemaphore(self.concurrency)
+
+    def limiter(self):
+        """Rate limiter allowing ``max_rate`` jobs per ``time_period`` seconds."""
+        return RateLimiter(max_rate=self.max_rate, time_period=self.time_period)
+
+    def pool(self, browser, **context_options):
+        """Context pool with one context per concurrent scrape."""
+        return ContextPool(browser, size=self.concurrency, **context_options)
+
+
+@retry_async(
+    max_attempts=MAX_ATTEMPTS,
+    backoff=2.0,
+    exceptions=(TooManyRequestsError, ServerError),
+    jitter=1.0,
+    respect_suggested_wait=True,
+    max_suggested_wait=MAX_RETRY_WAIT
+)
+async def scrape_one(url, sem, limiter, pool):
+    """Scrape a single job in a pooled context, bounded by the semaphore and rate limiter.
+
+    Throttled (429) and server error (5xx) attempts back off exponentially
+    without holding a pool slot.
+    """
+    async with sem:
+        async with limiter:
+            async with pool.lease() as page:
+                job_scraper = JobScraper(page)
+                return await job_scraper.scrape(url)
+
+
+def job_to_record(job):
+    """Convert a scraped Job into the dict written to the output file."""
+    return {
+        "job_title": job.job_title,
+        "company": job.company,
+        "company_url": job.company_linkedin_url,
+        "location": job.location,
+        "posted_date": job.posted_date,
+        "applicant_count": job.applicant_count,
+        "job_description": job.job_description,
+        "benefits": job.benefits,
+        "url": job.linkedin_url
+    }
+
+
+async def process_one(label, url, sem, limiter, pool, queue):
+    """Scrape one job, log it, and hand the record to the writer. Returns True on success."""
+    try:
+        job = await scrape_one(url, sem, limiter, pool)
+    except Exception as e:
+        logger.error("\n[%s] %s\n  ERROR: %s", label, url, e)
+        return False
+
+    # Display job info
+    logger.info(
+        "\n[%s] %s\n  Title: %s\n  Company: %s\n  Location: %s\n  Posted: %s\n  Applicants: %s",
+        label, url, job.job_title, job.company, job.location, job.posted_date, job.applicant_count
+    )
+
+    await queue.put(job_to_record(job))
+    return True
+
+
+async def write_records(queue, f):
+    """Single writer: append each record as one JSON line until a None sentinel arrives."""
+    while True:
+        record = await queue.get()
+        if record is None:
+            break
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+
+
+def load_done_urls(path):
+    """Return the set of job URLs already written to a previous run's JSONL output."""
+    done = set()
+    if not os.path.exists(path):
+        return done
+
+    # Decode per line: an interrupted write can cut a multibyte character in half
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                done.add(json.loads(line.decode("utf-8"))["url"])
+            except (UnicodeDecodeError, ValueError, KeyError, TypeError):
+                # Skip blank or partially written lines from an interrupted run
+                continue
+    return done
+
 
+async def main(endpoint_file=None, config=None):
+    config = config or ScrapeConfig()
 
-async def main():
     # Read the job URLs
     with open("saved_job_urls.txt", "r") as f:
         job_urls = [line.strip() for line in f if line.strip()]
 
-    print(f"Found {len(job_urls)} saved jobs to scrape\n")
-
-    async with BrowserManager(headless=False) as browser:
-        print("Loading session...")
-        await browser.load_session("session.json")
-
-        job_scraper = JobScraper(browser.page)
-        jobs_data = []
-
-        for i, url in enumerate(job_urls, 1):
-            try:
-                print(f"\n[{i}/{len(job_urls)}] Scraping: {url}")
-
-                job = await job_scraper.scrape(url)
-
-                # Display job info
-                print(f"  Title: {job.job_title}")
-                print(f"  Company: {job.company}")
-                print(f"  Location: {job.location}")
-                print(f"  Posted: {job.posted_date}")
-                print(f"  Applicants: {job.applicant_count}")
-
-                # Save to list
-                jobs_data.append({
-                    "job_title": job.job_title,
-                    "company": job.company,
-                    "company_url": job.company_linkedin_url,
-                    "location": job.location,
-                    "posted_date": job.posted_date,
-                    "applicant_count": job.applicant_count,
-                    "job_description": job.job_description,
-                    "benefits": job.benefits,
-                    "url": job.linkedin_url
-                })
-
-                # Rate limiting - wait between requests
-                if i < len(job_urls):  # Don't wait after last one
-                    print("  Waiting 3 seconds...")
-                    await asyncio.sleep(3)
-
-            except Exception as e:
-                print(f"  ERROR: {e}")
-                continue
-
-        # Save to JSON
-        output_file = "saved_jobs_details.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(jobs_data, f, indent=2, ensure_ascii=False)
-
-        print("\n" + "=" * 60)
-        print(f"SUCCESS! Scraped {len(jobs_data)}/{len(job_urls)} jobs")
-        print(f"Results saved to: {output_file}")
-        print("=" * 60)
+    logger.info("Found %d saved jobs", len(job_urls))
+
+    # Resume: skip jobs already saved by an earlier run
+    done = load_done_urls(OUTPUT_FILE)
+    if done:
+        remaining = [url for url in job_urls if url not in done]
+        logger.info("Skipping %d jobs already in %s", len(job_urls) - len(remaining), OUTPUT_FILE)
+        job_urls = remaining
+
+    logger.info("%d jobs to scrape\n", len(job_urls))
+
+    if not job_urls:
+        return
+
+    async with BrowserManager(
+        headless=False,
+        endpoint_file=endpoint_file,
+        block_resources=True,
+        args=LAUNCH_ARGS
+    ) as browser:
+        logger.info("Loading session into %d browser contexts...", config.concurrency)
+        async with config.pool(
+            browser.browser,
+            storage_state="session.json",
+            block_resources=True,
+            viewport=browser.viewport
+        ) as pool:
+            sem = config.semaphore()
+            limiter = config.limiter()
+
+            logger.info("Scraping with up to %d concurrent pages (%d jobs per %gs)...",
+                        config.concurrency, config.max_rate, config.time_period)
+
+            # Stream each job to disk as soon as it is scraped
+            with open(OUTPUT_FILE, "a", encoding="utf-8") as f:
+                # Terminate a line left half-written by an interrupted run
+                if f.tell() > 0 and not file_ends_with_newline(OUTPUT_FILE):
+                    f.write("\n")
+
+                queue = asyncio.Queue()
+                writer = asyncio.create_task(write_records(queue, f))
+
+                total = len(job_urls)
+                results = await asyncio.gather(
+                    *[process_one(f"{i}/{total}", url, sem, limiter, pool, queue)
+                      for i, url in enumerate(job_urls, 1)],
+                    return_exceptions=True
+                )
+
+                await queue.put(None)
+                await writer
+
+        scraped = sum(1 for result in results if result is True)
+
+        logger.info("\n" + "=" * 60)
+        logger.info("SUCCESS! Scraped %d/%d jobs", scraped, len(job_urls))
+        logger.info("Results appended to: %s", OUTPUT_FILE)
+        logger.info("=" * 60)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_browser_args(parser, concurrency=True)
+    args = parser.parse_args()
+
+    listener = setup_queue_logging()
+    try:
+        asyncio.run(main(
+            endpoint_file=ENDPOINT_FILE if args.reuse_endpoint else None,
+            config=ScrapeConfig(concurrency=args.concurrency)
+        ))
+    finally:
+        listener.stop()
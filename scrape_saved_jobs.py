@@ -1,128 +1,232 @@
 """Scrape saved jobs - skip login detection, just try it."""
 
+import argparse
 import asyncio
 import json
+import logging
+import os
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from linkedin_scraper import BrowserManager, SavedJobsScraper, JobScraper
+from linkedin_scraper.core import setup_queue_logging
 
+from script_utils import (
+    ENDPOINT_FILE,
+    PROFILE_DIR,
+    add_browser_args,
+    file_ends_with_newline,
+    log_wait_progress,
+)
 
-async def main():
-    async with BrowserManager(headless=False) as browser:
-        print("Loading session...")
+logger = logging.getLogger(__name__)
+
+# One URL per line, appended page by page
+URLS_FILE = "saved_job_urls.txt"
+
+# How long to wait for a manual login (seconds)
+LOGIN_TIMEOUT = 120
+
+
+async def open_saved_jobs(browser):
+    """Load the session and open the saved jobs page, waiting for a manual login if needed.
+
+    With a persistent profile the profile's own cookies are used as is;
+    session.json would overwrite them with older ones.
+    """
+    if browser.user_data_dir:
+        logger.info("Using cookies from browser profile %s", browser.user_data_dir)
+    else:
+        logger.info("Loading session...")
         await browser.load_session("session.json")
 
-        print("\n" + "=" * 60)
-        print("Navigating to your saved jobs page...")
-        print("If you see a login page, please log in manually")
-        print("=" * 60)
-
-        # Navigate directly to saved jobs
-        await browser.page.goto("https://www.linkedin.com/my-items/saved-jobs/", timeout=30000)
-        await asyncio.sleep(5)
-
-        current_url = browser.page.url
-        print(f"\nCurrent URL: {current_url}")
-
-        # Check if we're on the login page
-        if "login" in current_url or "authwall" in current_url:
-            print("\n" + "=" * 60)
-            print("You need to log in manually in the browser window")
-            print("After logging in, the script will continue...")
-            print("Waiting 2 minutes...")
-            print("=" * 60)
-
-            # Wait for navigation away from login page
-            for i in range(24):  # 24 x 5 seconds = 2 minutes
-                await asyncio.sleep(5)
-                current_url = browser.page.url
-                if "my-items/saved-jobs" in current_url or "feed" in current_url:
-                    print(f"\n[{(i+1)*5}s] Login detected! Saving session...")
-                    await browser.save_session("session.json")
-
-                    # Navigate back to saved jobs
-                    await browser.page.goto("https://www.linkedin.com/my-items/saved-jobs/", timeout=30000)
-                    await asyncio.sleep(3)
-                    break
-                print(f"[{(i+1)*5}s] Waiting for login...")
-
-        print("\nAttempting to scrape saved jobs...")
-        print("(This might fail if not properly logged in)")
+    logger.info("\n" + "=" * 60)
+    logger.info("Navigating to your saved jobs page...")
+    logger.info("If you see a login page, please log in manually")
+    logger.info("=" * 60)
+
+    # Navigate directly to saved jobs
+    await browser.page.goto("https://www.linkedin.com/my-items/saved-jobs/", timeout=30000)
+    await asyncio.sleep(5)
+
+    current_url = browser.page.url
+    logger.info("\nCurrent URL: %s", current_url)
+
+    # Check if we're on the login page
+    if "login" in current_url or "authwall" in current_url:
+        logger.info("\n" + "=" * 60)
+        logger.info("You need to log in manually in the browser window")
+        logger.info("After logging in, the script will continue...")
+        logger.info("Waiting 2 minutes...")
+        logger.info("=" * 60)
+
+        # Wait for navigation away from login page
+        progress = asyncio.create_task(
+            log_wait_progress(LOGIN_TIMEOUT, interval=5, message="Waiting for login...")
+        )
+        start = asyncio.get_running_loop().time()
+        try:
+            await browser.page.wait_for_url(
+                lambda url: "my-items/saved-jobs" in url or "feed" in url,
+                timeout=LOGIN_TIMEOUT * 1000
+            )
+            logged_in = True
+        except PlaywrightTimeoutError:
+            logged_in = False
+        finally:
+            progress.cancel()
+
+        if logged_in:
+            elapsed = int(asyncio.get_running_loop().time() - start)
+            logger.info("\n[%ds] Login detected! Saving session...", elapsed)
+            await browser.save_session("session.json")
+
+            # Navigate back to saved jobs
+            await browser.page.goto("https://www.linkedin.com/my-items/saved-jobs/", timeout=30000)
+            await asyncio.sleep(3)
+
+
+# Runs one page of pagination in the browser: scroll, read job hrefs, then
+# click "Next" if it is enabled. One round-trip per page instead of many.
+SCRAPE_PAGE_JS = """async () => {
+    window.scrollTo(0, document.body.scrollHeight);
+    await new Promise(r => setTimeout(r, 2000));
+
+    const hrefs = [...document.querySelectorAll('a[href*="/jobs/view/"]')]
+        .map(a => a.getAttribute('href'));
+
+    const next = document.querySelector('button[aria-label="View next page"]')
+        || [...document.querySelectorAll('button')].find(b => b.textContent.trim() === 'Next');
+    const hasNext = !!next && !next.disabled;
+    if (hasNext) next.click();
+
+    return {hrefs, nextFound: !!next, hasNext};
+}"""
+
+
+async def iter_saved_job_pages(page, seen=None):
+    """Walk the saved jobs pagination, yielding (page_num, new_urls) as each page is read.
+
+    URLs already in ``seen`` are never yielded; the set is updated in place.
+    """
+    if seen is None:
+        seen = set()
+    page_num = 1
+
+    while True:
+        logger.info("\n=== Scraping page %d ===", page_num)
+
+        result = await page.evaluate(SCRAPE_PAGE_JS)
+        hrefs = result["hrefs"]
+        logger.info("Found %d job links on page %d", len(hrefs), page_num)
+
+        # Extract URLs not seen on earlier pages
+        new_urls = [url for url in SavedJobsScraper.clean_job_urls(hrefs) if url not in seen]
+        seen.update(new_urls)
+
+        yield page_num, new_urls
+
+        if not result["nextFound"]:
+            logger.info("No 'Next' button found - only one page")
+            break
+        if not result["hasNext"]:
+            logger.info("'Next' button is disabled - reached last page")
+            break
+
+        logger.info("Clicked 'Next' button to go to page %d...", page_num + 1)
+        await asyncio.sleep(3)  # Wait for next page to load
+        page_num += 1
+
+
+def load_saved_urls(path=URLS_FILE):
+    """Return the job URLs already written to the URL file, in file order."""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def open_urls_file(path=URLS_FILE):
+    """Open the URL file for appending, making sure new URLs start on their own line."""
+    needs_newline = (
+        os.path.exists(path) and os.path.getsize(path) > 0
+        and not file_ends_with_newline(path)
+    )
+
+    f = open(path, "a")
+    if needs_newline:
+        f.write("\n")
+    return f
+
+
+def append_urls(f, urls):
+    """Append URLs to an open URL file, one per line, and flush so a crash keeps them."""
+    if urls:
+        f.write("\n".join(urls) + "\n")
+        f.flush()
+
+
+async def main(endpoint_file=None, user_data_dir=None):
+    async with BrowserManager(
+        headless=False,
+        endpoint_file=endpoint_file,
+        user_data_dir=user_data_dir
+    ) as browser:
+        await open_saved_jobs(browser)
+
+        logger.info("\nAttempting to scrape saved jobs...")
+        logger.info("(This might fail if not properly logged in)")
 
         try:
             # Get job URLs from all pages
             await asyncio.sleep(3)
 
-            all_job_urls = []
-            page_num = 1
-
-            while True:
-                print(f"\n=== Scraping page {page_num} ===")
-
-                # Scroll to load jobs on current page
-                await browser.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(2)
-
-                # Get job links from current page
-                job_links = await browser.page.locator('a[href*="/jobs/view/"]').all()
-                print(f"Found {len(job_links)} job links on page {page_num}")
-
-                # Extract unique URLs from current page
-                for link in job_links:
-                    try:
-                        href = await link.get_attribute("href")
-                        if href and "/jobs/view/" in href:
-                            clean_url = href.split("?")[0] if "?" in href else href
-                            if not clean_url.startswith("http"):
-                                clean_url = f"https://www.linkedin.com{clean_url}"
-                            if clean_url not in all_job_urls:
-                                all_job_urls.append(clean_url)
-                    except:
-                        continue
-
-                # Look for "Next" button
-                next_button = browser.page.locator('button[aria-label="View next page"], button:has-text("Next")')
-                next_button_count = await next_button.count()
-
-                if next_button_count > 0:
-                    # Check if button is enabled
-                    is_disabled = await next_button.first.is_disabled()
-
-                    if not is_disabled:
-                        print(f"Clicking 'Next' button to go to page {page_num + 1}...")
-                        await next_button.first.click()
-                        await asyncio.sleep(3)  # Wait for next page to load
-                        page_num += 1
-                    else:
-                        print("'Next' button is disabled - reached last page")
-                        break
-                else:
-                    print("No 'Next' button found - only one page")
-                    break
-
-            job_urls = all_job_urls
-            print(f"\n=== Total: Extracted {len(job_urls)} unique job URLs from {page_num} page(s) ===")
+            # Reruns only add URLs that aren't in the file yet
+            existing_urls = load_saved_urls()
+            seen = set(existing_urls)
+            if existing_urls:
+                logger.info("%d job URLs already in %s", len(existing_urls), URLS_FILE)
+
+            job_urls = []
+            page_num = 0
+
+            # Write each page's URLs as soon as it is read
+            with open_urls_file() as f:
+                async for page_num, new_urls in iter_saved_job_pages(browser.page, seen):
+                    append_urls(f, new_urls)
+                    job_urls.extend(new_urls)
+
+            logger.info("\n=== Total: Extracted %d new job URLs from %d page(s) ===", len(job_urls), page_num)
 
             if job_urls:
-                print("\nYour saved jobs:")
+                logger.info("\nYour new saved jobs:")
                 for i, url in enumerate(job_urls, 1):
-                    print(f"{i}. {url}")
-
-                # Save to file
-                with open("saved_job_urls.txt", "w") as f:
-                    f.write("\n".join(job_urls))
+                    logger.info("%d. %s", i, url)
 
-                print(f"\nSaved URLs to: saved_job_urls.txt")
+                logger.info("\nSaved URLs to: %s", URLS_FILE)
+            elif existing_urls:
+                logger.info("\nNo new saved jobs since the last run (%s is up to date)", URLS_FILE)
             else:
-                print("\nNo job URLs found. Make sure you:")
-                print("1. Are logged in")
-                print("2. Have saved jobs on LinkedIn")
-                print("3. Are on the saved jobs page")
+                logger.info("\nNo job URLs found. Make sure you:")
+                logger.info("1. Are logged in")
+                logger.info("2. Have saved jobs on LinkedIn")
+                logger.info("3. Are on the saved jobs page")
 
         except Exception as e:
-            print(f"\nError: {e}")
+            logger.error("\nError: %s", e)
 
-        print("\nKeeping browser open for 30 seconds so you can verify...")
+        logger.info("\nKeeping browser open for 30 seconds so you can verify...")
         await asyncio.sleep(30)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_browser_args(parser, profile=True)
+    args = parser.parse_args()
+
+    listener = setup_queue_logging()
+    try:
+        asyncio.run(main(
+            endpoint_file=ENDPOINT_FILE if args.reuse_endpoint else None,
+            user_data_dir=PROFILE_DIR if args.profile else None
+        ))
+    finally:
+        listener.stop()
@@ -0,0 +1,147 @@
+"""Scrape saved job URLs and their details in one pass.
+
+Job detail workers start on page 1's jobs while later pages of the saved
+jobs list are still being paginated.
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+from linkedin_scraper import BrowserManager
+from linkedin_scraper.core import setup_queue_logging
+
+from script_utils import ENDPOINT_FILE, add_browser_args, file_ends_with_newline
+from scrape_saved_jobs import (
+    URLS_FILE,
+    open_saved_jobs,
+    iter_saved_job_pages,
+    load_saved_urls,
+    open_urls_file,
+    append_urls,
+)
+from scrape_job_details import (
+    LAUNCH_ARGS,
+    OUTPUT_FILE,
+    ScrapeConfig,
+    process_one,
+    write_records,
+    load_done_urls,
+)
+
+logger = logging.getLogger(__name__)
+
+# Cap on URLs waiting for a worker, so pagination can't run far ahead
+QUEUE_SIZE = 200
+
+
+async def produce_urls(page, url_queue, done, num_workers):
+    """Push new saved job URLs onto the queue page by page, then one None per worker.
+
+    Each page's URLs are also appended to the URL file as soon as they are read.
+    Returns (all saved job URLs found, number skipped as already in ``done``).
+    """
+    all_job_urls = []
+    skipped = 0
+    listed = set(load_saved_urls())
+    try:
+        with open_urls_file() as f:
+            async for page_num, new_urls in iter_saved_job_pages(page):
+                all_job_urls.extend(new_urls)
+                append_urls(f, [url for url in new_urls if url not in listed])
+                listed.update(new_urls)
+                for url in new_urls:
+                    if url in done:
+                        skipped += 1
+                    else:
+                        await url_queue.put(url)
+    except Exception as e:
+        # Keep whatever was found so far; workers still finish queued jobs
+        logger.error("\nError while paginating saved jobs: %s", e)
+    finally:
+        for _ in range(num_workers):
+            await url_queue.put(None)
+    return all_job_urls, skipped
+
+
+async def consume_urls(url_queue, sem, limiter, pool, record_queue, labels):
+    """Scrape URLs from the queue until a None sentinel arrives.
+
+    ``labels`` is an iterator shared by all workers, numbering jobs in pick-up order.
+    Returns (number attempted, number scraped).
+    """
+    attempted = scraped = 0
+    while (url := await url_queue.get()) is not None:
+        attempted += 1
+        if await process_one(str(next(labels)), url, sem, limiter, pool, record_queue):
+            scraped += 1
+    return attempted, scraped
+
+
+async def main(endpoint_file=None, config=None):
+    config = config or ScrapeConfig()
+    done = load_done_urls(OUTPUT_FILE)
+
+    async with BrowserManager(
+        headless=False,
+        endpoint_file=endpoint_file,
+        args=LAUNCH_ARGS
+    ) as browser:
+        await open_saved_jobs(browser)
+        await asyncio.sleep(3)
+
+        async with config.pool(
+            browser.browser,
+            storage_state="session.json",
+            block_resources=True,
+            viewport=browser.viewport
+        ) as pool:
+            sem = config.semaphore()
+            limiter = config.limiter()
+            url_queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+            labels = itertools.count(1)
+
+            logger.info("Scraping with up to %d concurrent pages (%d jobs per %gs)...",
+                        config.concurrency, config.max_rate, config.time_period)
+
+            with open(OUTPUT_FILE, "a", encoding="utf-8") as f:
+                # Terminate a line left half-written by an interrupted run
+                if f.tell() > 0 and not file_ends_with_newline(OUTPUT_FILE):
+                    f.write("\n")
+
+                record_queue = asyncio.Queue()
+                writer = asyncio.create_task(write_records(record_queue, f))
+
+                (job_urls, skipped), *worker_counts = await asyncio.gather(
+                    produce_urls(browser.page, url_queue, done, config.concurrency),
+                    *[consume_urls(url_queue, sem, limiter, pool, record_queue, labels)
+                      for _ in range(config.concurrency)]
+                )
+                attempted = sum(count[0] for count in worker_counts)
+                scraped = sum(count[1] for count in worker_counts)
+
+                await record_queue.put(None)
+                await writer
+
+        logger.info("\n" + "=" * 60)
+        logger.info("Found %d saved jobs (URLs in %s)", len(job_urls), URLS_FILE)
+        if skipped:
+            logger.info("Skipped %d jobs already in %s", skipped, OUTPUT_FILE)
+        logger.info("SUCCESS! Scraped %d/%d new jobs", scraped, attempted)
+        logger.info("Results appended to: %s", OUTPUT_FILE)
+        logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_browser_args(parser, concurrency=True)
+    args = parser.parse_args()
+
+    listener = setup_queue_logging()
+    try:
+        asyncio.run(main(
+            endpoint_file=ENDPOINT_FILE if args.reuse_endpoint else None,
+            config=ScrapeConfig(concurrency=args.concurrency)
+        ))
+    finally:
+        listener.stop()
@@ -0,0 +1,72 @@
+"""Settings and command-line flags shared by the scripts in this directory."""
+
+import argparse
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Shared between scripts so they can attach to the same running browser
+ENDPOINT_FILE = ".browser_endpoint"
+
+# Persistent browser profile used with --profile (cookies, TLS tickets, cache)
+PROFILE_DIR = ".lnkd_profile"
+
+# Jobs scraped at once unless --concurrency or $LNKD_CONCURRENCY says otherwise
+DEFAULT_CONCURRENCY = 6
+
+
+def positive_int(value):
+    """Parse a whole number of at least 1; usable as an argparse type."""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise argparse.ArgumentTypeError(f"invalid positive int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def file_ends_with_newline(path):
+    """Check whether the last byte of a non-empty file is a newline."""
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+async def log_wait_progress(total_seconds, interval=10, message="Waiting..."):
+    """Log elapsed and remaining time every interval until done or cancelled."""
+    elapsed = 0
+    while elapsed < total_seconds:
+        await asyncio.sleep(interval)
+        elapsed += interval
+        logger.info("[%ds] %s (%ds remaining)", elapsed, message, total_seconds - elapsed)
+
+
+def add_browser_args(parser, profile=False, concurrency=False):
+    """Add --reuse-endpoint to parser, plus --profile and --concurrency when asked for."""
+    # A persistent profile is its own browser, so it can't attach to a shared one
+    group = parser.add_mutually_exclusive_group() if profile else parser
+    group.add_argument(
+        "--reuse-endpoint",
+        action="store_true",
+        help=f"Attach to the browser recorded in {ENDPOINT_FILE} (launching one if needed) "
+             "and leave it running for the next script"
+    )
+    if profile:
+        group.add_argument(
+            "--profile",
+            action="store_true",
+            help=f"Keep a persistent browser profile in {PROFILE_DIR} so connections and "
+                 "cookies are reused between runs (can't be combined with --reuse-endpoint)"
+        )
+    if concurrency:
+        # A string default goes through positive_int too, so a bad env value is a usage error
+        parser.add_argument(
+            "--concurrency",
+            type=positive_int,
+            default=os.getenv("LNKD_CONCURRENCY", str(DEFAULT_CONCURRENCY)),
+            help="Jobs scraped at once, also the browser context pool size "
+                 f"(default: $LNKD_CONCURRENCY or {DEFAULT_CONCURRENCY})"
+        )
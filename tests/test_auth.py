@@ -23,3 +23,18 @@ async def test_is_logged_in_with_session(browser_with_session):
     await browser_with_session.page.wait_for_load_state("domcontentloaded", timeout=15000)
     logged_in = await is_logged_in(browser_with_session.page)
     assert logged_in is True
+
+
+@pytest.mark.asyncio
+async def test_is_logged_in_cache_cleared_on_navigation():
+    """Test cached is_logged_in result is dropped when the page navigates."""
+    from linkedin_scraper.core.auth import _login_cache
+
+    async with BrowserManager(headless=True) as browser:
+        await browser.page.goto("https://www.example.com")
+        first = await is_logged_in(browser.page)
+        assert await is_logged_in(browser.page) is first
+        assert browser.page in _login_cache
+
+        await browser.page.goto("https://www.example.org")
+        assert browser.page not in _login_cache
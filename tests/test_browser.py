@@ -1,7 +1,7 @@
 """Tests for BrowserManager."""
 import pytest
 from pathlib import Path
-from linkedin_scraper import BrowserManager
+from linkedin_scraper import BrowserManager, ContextPool
 
 
 @pytest.mark.asyncio
@@ -52,3 +52,66 @@ async def test_browser_manager_headless_mode():
         await browser.page.goto("https://www.example.com")
         content = await browser.page.content()
         assert len(content) > 0
+
+
+@pytest.mark.asyncio
+async def test_context_pool_lease():
+    """Test ContextPool hands out pages and reuses contexts."""
+    async with BrowserManager(headless=True) as browser:
+        async with ContextPool(browser.browser, size=2) as pool:
+            async with pool.lease() as page:
+                await page.goto("https://www.example.com")
+                assert page.context in browser.browser.contexts
+            assert page.is_closed()
+
+            first = await pool.acquire()
+            second = await pool.acquire()
+            assert first is not second
+            await pool.release(first)
+            await pool.release(second)
+
+
+@pytest.mark.asyncio
+async def test_context_pool_replaces_closed_context():
+    """Test ContextPool recreates a context that was closed while leased."""
+    async with BrowserManager(headless=True) as browser:
+        async with ContextPool(browser.browser, size=1) as pool:
+            context = await pool.acquire()
+            await context.close()
+            await pool.release(context)
+
+            replacement = await pool.acquire()
+            assert replacement is not context
+            await replacement.new_page()
+            await pool.release(replacement)
+
+
+@pytest.mark.asyncio
+async def test_browser_managers_share_playwright():
+    """Test overlapping BrowserManagers share one Playwright driver."""
+    async with BrowserManager(headless=True) as first:
+        async with BrowserManager(headless=True) as second:
+            assert first._playwright is second._playwright
+        # Closing the inner manager must not stop the shared driver
+        await first.page.goto("https://www.example.com")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_browser_manager_persistent_profile(tmp_path):
+    """Test user_data_dir keeps cookies across runs."""
+    profile_dir = tmp_path / "profile"
+
+    async with BrowserManager(headless=True, user_data_dir=str(profile_dir)) as browser:
+        # The profile's default tab is reused instead of opening a second one
+        assert browser.context.pages == [browser.page]
+        await browser.page.goto("https://www.example.com")
+        await browser.context.add_cookies([{
+            "name": "persist", "value": "1",
+            "domain": "www.example.com", "path": "/",
+            "expires": 4102444800,
+        }])
+
+    async with BrowserManager(headless=True, user_data_dir=str(profile_dir)) as browser:
+        cookies = await browser.context.cookies("https://www.example.com")
+        assert any(cookie["name"] == "persist" for cookie in cookies)
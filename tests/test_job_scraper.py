@@ -1,7 +1,14 @@
 """Tests for JobScraper and JobSearchScraper."""
 
 import pytest
-from linkedin_scraper import JobScraper, JobSearchScraper, SavedJobsScraper
+from linkedin_scraper import (
+    JobScraper,
+    JobSearchScraper,
+    RateLimitError,
+    SavedJobsScraper,
+    ServerError,
+    TooManyRequestsError,
+)
 
 from linkedin_scraper.models import Job
 
@@ -110,3 +117,66 @@ def test_job_model_to_json():
     json_str = job.to_json()
     assert isinstance(json_str, str)
     assert "Software Engineer" in json_str
+
+
+@pytest.mark.unit
+def test_saved_jobs_clean_job_urls():
+    """Test saved job hrefs are made absolute, stripped of queries and deduped."""
+    hrefs = [
+        "/jobs/view/123/?refId=abc",
+        "https://www.linkedin.com/jobs/view/456/",
+        "/jobs/view/123/?trackingId=xyz",
+        "/company/microsoft/",
+        None,
+    ]
+
+    assert SavedJobsScraper.clean_job_urls(hrefs) == [
+        "https://www.linkedin.com/jobs/view/123/",
+        "https://www.linkedin.com/jobs/view/456/",
+    ]
+
+
+class _FakeResponse:
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+
+
+class _FakePage:
+    def __init__(self, response):
+        self.response = response
+
+    async def goto(self, url, **kwargs):
+        return self.response
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_navigate_and_wait_maps_429_to_too_many_requests():
+    """Test HTTP 429 raises TooManyRequestsError carrying Retry-After."""
+    scraper = JobScraper(_FakePage(_FakeResponse(429, {"retry-after": "120"})))
+
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        await scraper.navigate_and_wait("https://www.linkedin.com/jobs/view/123/")
+    assert exc_info.value.suggested_wait_time == 120
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_navigate_and_wait_maps_5xx_to_server_error():
+    """Test HTTP 5xx raises ServerError."""
+    scraper = JobScraper(_FakePage(_FakeResponse(503)))
+
+    with pytest.raises(ServerError):
+        await scraper.navigate_and_wait("https://www.linkedin.com/jobs/view/123/")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_navigate_and_wait_maps_999_to_non_retryable_rate_limit():
+    """Test LinkedIn's 999 Request denied is a plain RateLimitError, not a ServerError."""
+    scraper = JobScraper(_FakePage(_FakeResponse(999)))
+
+    with pytest.raises(RateLimitError) as exc_info:
+        await scraper.navigate_and_wait("https://www.linkedin.com/jobs/view/123/")
+    assert not isinstance(exc_info.value, (TooManyRequestsError, ServerError))
@@ -0,0 +1,51 @@
+"""Tests for the helpers in scrape_job_details."""
+import argparse
+import json
+
+import pytest
+from scrape_job_details import ScrapeConfig, load_done_urls
+from script_utils import file_ends_with_newline, positive_int
+
+
+@pytest.mark.unit
+def test_load_done_urls_missing_file(tmp_path):
+    """Test a missing output file means nothing is done yet."""
+    assert load_done_urls(tmp_path / "missing.jsonl") == set()
+
+
+@pytest.mark.unit
+def test_load_done_urls_skips_damaged_lines(tmp_path):
+    """Test blank, truncated and cut multibyte lines are skipped, not fatal."""
+    path = tmp_path / "out.jsonl"
+    good = json.dumps({"url": "https://www.linkedin.com/jobs/view/1/", "company": "Café"},
+                      ensure_ascii=False)
+    truncated = '{"url": "https://www.linkedin.com/jobs/view/2/", "job_desc'
+    cut_multibyte = '{"url": "https://www.linkedin.com/jobs/view/3/", "company": "Caf'.encode() + "é".encode()[:1]
+    path.write_bytes(
+        good.encode() + b"\n\n" + truncated.encode() + b"\n"
+        + b'{"title": "no url"}\n' + cut_multibyte
+    )
+
+    assert load_done_urls(path) == {"https://www.linkedin.com/jobs/view/1/"}
+
+
+@pytest.mark.unit
+def test_file_ends_with_newline(tmp_path):
+    """Test detection of a half-written last line."""
+    path = tmp_path / "out.jsonl"
+    path.write_bytes(b'{"url": "a"}\n')
+    assert file_ends_with_newline(path)
+
+    path.write_bytes(b'{"url": "a"}\n{"url": ')
+    assert not file_ends_with_newline(path)
+
+
+@pytest.mark.unit
+def test_positive_int_rejects_bad_concurrency():
+    """Test --concurrency values are validated before any browser starts."""
+    assert positive_int("3") == 3
+    for value in ("0", "-2", "six"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_int(value)
+    with pytest.raises(ValueError):
+        ScrapeConfig(concurrency=0)
@@ -0,0 +1,140 @@
+"""Tests for core utilities."""
+import asyncio
+import time
+
+import pytest
+from linkedin_scraper import BrowserManager, RateLimiter, TooManyRequestsError
+from linkedin_scraper.core import retry_async, scroll_until_loaded
+from linkedin_scraper.core import utils
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_burst():
+    """Test RateLimiter lets max_rate operations through immediately."""
+    limiter = RateLimiter(max_rate=5, time_period=60)
+    start = time.monotonic()
+    for _ in range(5):
+        async with limiter:
+            pass
+    assert time.monotonic() - start < 0.5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rate_limiter_paces_after_burst():
+    """Test RateLimiter waits for a refill once the bucket is empty."""
+    limiter = RateLimiter(max_rate=2, time_period=0.5)
+    start = time.monotonic()
+    await asyncio.gather(*[limiter.acquire() for _ in range(3)])
+    # Third token needs 0.25s to refill
+    assert time.monotonic() - start >= 0.2
+
+
+@pytest.mark.unit
+def test_rate_limiter_rejects_invalid_rate():
+    """Test RateLimiter rejects non-positive settings."""
+    with pytest.raises(ValueError):
+        RateLimiter(max_rate=0)
+
+
+@pytest.fixture
+def recorded_sleeps(monkeypatch):
+    """Record retry_async waits instead of sleeping."""
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(utils.asyncio, "sleep", fake_sleep)
+    return sleeps
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_retry_async_adds_bounded_jitter(recorded_sleeps):
+    """Test retry_async adds up to jitter seconds to each backoff wait."""
+    calls = []
+
+    @retry_async(max_attempts=3, backoff=2.0, exceptions=(ValueError,), jitter=0.5)
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ValueError("flaky")
+        return "ok"
+
+    assert await flaky() == "ok"
+    assert len(recorded_sleeps) == 2
+    assert 1 <= recorded_sleeps[0] <= 1.5
+    assert 2 <= recorded_sleeps[1] <= 2.5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_retry_async_respects_suggested_wait(recorded_sleeps):
+    """Test retry_async waits at least suggested_wait_time when asked to."""
+    @retry_async(max_attempts=2, exceptions=(TooManyRequestsError,), respect_suggested_wait=True)
+    async def throttled():
+        raise TooManyRequestsError("429", suggested_wait_time=30)
+
+    with pytest.raises(TooManyRequestsError):
+        await throttled()
+    assert recorded_sleeps == [30]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_retry_async_gives_up_on_long_suggested_wait(recorded_sleeps):
+    """Test retry_async re-raises instead of sleeping past max_suggested_wait."""
+    calls = []
+
+    @retry_async(
+        max_attempts=5,
+        exceptions=(TooManyRequestsError,),
+        respect_suggested_wait=True,
+        max_suggested_wait=120
+    )
+    async def throttled():
+        calls.append(1)
+        raise TooManyRequestsError("429", suggested_wait_time=3600)
+
+    with pytest.raises(TooManyRequestsError):
+        await throttled()
+    assert len(calls) == 1
+    assert recorded_sleeps == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scroll_until_loaded_stops_without_new_content():
+    """Test scroll_until_loaded returns promptly when nothing more loads."""
+    async with BrowserManager(headless=True) as browser:
+        await browser.page.set_content(
+            "".join(f'<a href="/jobs/view/{i}/">job</a><br>' for i in range(3))
+        )
+        start = time.monotonic()
+        count = await scroll_until_loaded(
+            browser.page, 'a[href*="/jobs/view/"]', pause_time=0.5, max_scrolls=5
+        )
+        assert count == 3
+        # One timed-out wait, not one per scroll
+        assert time.monotonic() - start < 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scroll_until_loaded_counts_links_once_per_href():
+    """Test links to the same target (e.g. logo and title) count as one item."""
+    async with BrowserManager(headless=True) as browser:
+        await browser.page.set_content(
+            "".join(
+                f'<a href="/jobs/view/{i}/?ref=logo">logo</a>'
+                f'<a href="/jobs/view/{i}/?ref=title">title</a><br>'
+                for i in range(3)
+            )
+        )
+        count = await scroll_until_loaded(
+            browser.page, 'a[href*="/jobs/view/"]', limit=4, pause_time=0.2, max_scrolls=2
+        )
+        # Six anchors but only three jobs, so limit=4 must not stop early
+        assert count == 3